@@ -35,23 +35,47 @@ FIXES (v2.2):
 - Smooth interpolation across both flow and RPM dimensions
 - More accurate representation of VFD-controlled fan operation
 
+PERFORMANCE (v2.3):
+- Fan curves, RPM estimates and fan efficiencies are memoized (fixed RPM grid,
+  repeated operating points)
+- Base fan curve computed once at import; per-RPM curves only rescale it
+- Vectorized motor efficiency curve; plain-float fast paths for scalar calls
+- Lifecycle cost model broadcast over arrays of design margins
+- Lifecycle results memoized per design margin
+- matplotlib imported only when plots are generated; --no-plots skips them
+
 REQUIREMENTS:
     pip install matplotlib numpy --break-system-packages
+
+USAGE:
+    python Booster_Fan_Visualization_Enhanced.py [--no-plots] [--dpi DPI]
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
+from collections import namedtuple
+import argparse
+import bisect
+import functools
 import math
 import csv
+import io
 import os
 
-# Set style for professional plots
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (16, 10)
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.grid'] = True
-plt.rcParams['grid.alpha'] = 0.3
+# Output files are written next to the script (cwd when run interactively)
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.getcwd()
+
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """Import and style matplotlib on first use; CSV-only runs never load it"""
+    import matplotlib.pyplot as plt
+
+    # Set style for professional plots
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['figure.figsize'] = (16, 10)
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['axes.grid'] = True
+    plt.rcParams['grid.alpha'] = 0.3
+    return plt
 
 # ============================================================================
 # INPUT DATA FROM DATASHEET
@@ -80,6 +104,7 @@ electricity_escalation = 0.02
 motor_cost_per_kw = 650  # €/kW (includes motor + VFD)
 co2_intensity = 0.23  # kg CO2/kWh
 maintenance_cost_rate = 0.03  # Annual maintenance as fraction of CAPEX (3%)
+maintenance_escalation = 0.02  # Maintenance cost escalates with inflation (2%)
 
 # System curve parameters
 # Real systems have both static and dynamic pressure components
@@ -91,8 +116,8 @@ maintenance_cost_rate = 0.03  # Annual maintenance as fraction of CAPEX (3%)
 # Solving: k = (P_cclpb - P_cclpa) / (Q_cclpb² - Q_cclpa²)
 #          P_static = P_cclpa - k * Q_cclpa²
 
-system_dynamic_coeff = (pressure_cclpb - pressure_cclpa) / (flow_cclpb ** 2 - flow_cclpa ** 2)  # mbar/(m³/h)²
-system_static_pressure = pressure_cclpa - system_dynamic_coeff * (flow_cclpa ** 2)  # mbar
+system_dynamic_coeff = (pressure_cclpb - pressure_cclpa) / (flow_cclpb * flow_cclpb - flow_cclpa * flow_cclpa)  # mbar/(m³/h)²
+system_static_pressure = pressure_cclpa - system_dynamic_coeff * (flow_cclpa * flow_cclpa)  # mbar
 
 # Validate: static pressure should be >= 0 (physical constraint)
 if system_static_pressure < 0:
@@ -100,18 +125,20 @@ if system_static_pressure < 0:
     print(f"Warning: Calculated static pressure is negative ({system_static_pressure:.2f} mbar). "
           f"Assuming purely dynamic system (P_static = 0).")
     system_static_pressure = 0.0
-    system_dynamic_coeff = pressure_cclpa / (flow_cclpa ** 2)
+    system_dynamic_coeff = pressure_cclpa / (flow_cclpa * flow_cclpa)
 
 # Operating profile (part-load distribution)
 # Represents typical plant operation: % of time at each load point
+OpPoint = namedtuple('OpPoint', ['flow', 'pressure', 'hours_per_year'])
+
 operating_profile = {
-    'cclpe': {'flow': flow_cclpe, 'pressure': pressure_cclpe, 'hours_per_year': 80},   # 1% of time
-    'cclpa': {'flow': flow_cclpa, 'pressure': pressure_cclpa, 'hours_per_year': 7760},  # 97% of time
-    'cclpb': {'flow': flow_cclpb, 'pressure': pressure_cclpb, 'hours_per_year': 160},  # 2% of time
+    'cclpe': OpPoint(flow=flow_cclpe, pressure=pressure_cclpe, hours_per_year=80),    # 1% of time
+    'cclpa': OpPoint(flow=flow_cclpa, pressure=pressure_cclpa, hours_per_year=7760),  # 97% of time
+    'cclpb': OpPoint(flow=flow_cclpb, pressure=pressure_cclpb, hours_per_year=160),   # 2% of time
 }
 
 # Validate operating profile hours
-_total_profile_hours = sum(op['hours_per_year'] for op in operating_profile.values())
+_total_profile_hours = sum(op.hours_per_year for op in operating_profile.values())
 if abs(_total_profile_hours - operating_hours) > 1:  # Allow 1 hour tolerance for rounding
     raise ValueError(
         f"Operating profile hours ({_total_profile_hours}) do not match "
@@ -119,9 +146,19 @@ if abs(_total_profile_hours - operating_hours) > 1:  # Allow 1 hour tolerance fo
         f"Please adjust the profile to sum to {operating_hours} hours/year."
     )
 
+# Operating profile as parallel arrays (one entry per operating point) for the
+# vectorized cost calculations; the dict above remains the editable source
+_profile_flows = np.array([op.flow for op in operating_profile.values()], dtype=float)
+_profile_pressures = np.array([op.pressure for op in operating_profile.values()], dtype=float)
+_profile_hours = np.array([op.hours_per_year for op in operating_profile.values()], dtype=float)
+_profile_time_fractions = _profile_hours / _profile_hours.sum()  # Weights for time-averaged values
+
 # CURRENT DESIGN MARGIN - Single source of truth
 CURRENT_DESIGN_MARGIN_PCT = 31.7  # Current design is 132% of CCLPA (1.317 = 1 + 0.317)
 
+# Cost breakdown scenarios: 10% (best practice), 15% (API 560), Current Design
+SCENARIO_MARGINS_PCT = (10, 15, int(round(CURRENT_DESIGN_MARGIN_PCT)))
+
 # ============================================================================
 # FAN AFFINITY LAWS
 # ============================================================================
@@ -132,70 +169,153 @@ def fan_affinity_flow(Q_base, rpm_base, rpm_new):
 
 def fan_affinity_pressure(P_base, rpm_base, rpm_new):
     """Pressure varies with square of RPM"""
-    return P_base * (rpm_new / rpm_base) ** 2
+    rpm_ratio = rpm_new / rpm_base
+    return P_base * (rpm_ratio * rpm_ratio)
 
 def fan_affinity_power(W_base, rpm_base, rpm_new):
     """Power varies with cube of RPM"""
-    return W_base * (rpm_new / rpm_base) ** 3
+    rpm_ratio = rpm_new / rpm_base
+    return W_base * (rpm_ratio * rpm_ratio * rpm_ratio)
 
 # ============================================================================
 # FAN CHARACTERISTIC CURVES
 # ============================================================================
 
+# Base curve at 1500 RPM - polynomial approximation
+# Typical fan curve: ΔP = a - b*Q² (shutoff head to free delivery)
+# Depends only on the datasheet constants, so it is computed once at import
+# and generate_fan_curve() just rescales it with the affinity laws.
+
+# Use design point as reference (at 100% RPM)
+_Q_REF = flow_design
+_P_REF = pressure_design
+
+# Generate curve points (0 to 120% of design flow)
+_Q_RANGE_BASE = np.linspace(0, _Q_REF * 1.2, 100)
+
+# Polynomial fan curve: P = P_shutoff - k*Q²
+# At design point: P_ref = P_shutoff - k*Q_ref²
+# At free delivery: P = 0, Q = Q_max
+# Assume Q_max = 1.3 * Q_ref (typical for centrifugal fans)
+_Q_MAX_BASE = _Q_REF * 1.3
+
+# Calculate coefficients with protection against division by zero
+_ratio_squared = (_Q_REF / _Q_MAX_BASE) ** 2
+if _ratio_squared >= 0.99:  # Protection: if Q_ref too close to Q_max
+    raise ValueError(f"Q_ref ({_Q_REF}) too close to Q_max ({_Q_MAX_BASE}). Adjust Q_max multiplier.")
+
+_P_SHUTOFF_BASE = _P_REF / (1 - _ratio_squared)
+_K_FAN = _P_SHUTOFF_BASE / (_Q_MAX_BASE * _Q_MAX_BASE)
+
+# Base pressure curve at reference RPM
+_P_BASE = np.maximum(_P_SHUTOFF_BASE - _K_FAN * np.square(_Q_RANGE_BASE), 0)  # No negative pressure
+
+# Efficiency curve (parabolic, peaks around 70% of Q_max)
+_Q_PEAK_EFF = _Q_REF * 0.95  # Peak efficiency near design point
+_EFF_PEAK = 85.0  # Peak efficiency
+
+# Gaussian-like efficiency curve at reference RPM
+_EFF_BASE = _EFF_PEAK * np.exp(-np.square(_Q_RANGE_BASE - _Q_PEAK_EFF) / (2 * np.square(_Q_PEAK_EFF * 0.4)))
+
+for _arr in (_Q_RANGE_BASE, _P_BASE, _EFF_BASE):
+    _arr.setflags(write=False)
+
+
+def generate_fan_curves(rpms, base_rpm=1500):
+    """
+    Generate fan characteristic curves for several RPMs in one broadcast
+    Returns (Q, P, efficiency) arrays of shape (len(rpms), n_points);
+    row i is the curve at rpms[i] (see generate_fan_curve)
+    """
+    # Apply affinity laws for each RPM (rows) to the precomputed base curve (columns)
+    rpm_ratio = np.asarray(rpms, dtype=float)[:, None] / base_rpm
+    Q_actual = _Q_RANGE_BASE[None, :] * rpm_ratio
+    P_actual = _P_BASE[None, :] * (rpm_ratio * rpm_ratio)
+
+    efficiency = _EFF_BASE[None, :] * rpm_ratio ** 0.1  # Slight efficiency loss at lower RPM
+    efficiency = np.clip(efficiency, 0, 90)  # Cap at realistic values
+
+    return Q_actual, P_actual, efficiency
+
+
+@functools.lru_cache(maxsize=64)
 def generate_fan_curve(rpm, base_rpm=1500):
     """
     Generate fan characteristic curve for given RPM using affinity laws
     and typical centrifugal fan polynomial characteristics
+
+    Results are cached per (rpm, base_rpm); the returned arrays are shared
+    between callers and therefore read-only.
     """
-    # Base curve at 1500 RPM - polynomial approximation
-    # Typical fan curve: ΔP = a - b*Q² (shutoff head to free delivery)
-
-    # Use design point as reference (at 100% RPM)
-    Q_ref = flow_design
-    P_ref = pressure_design
-
-    # Generate curve points (0 to 120% of design flow)
-    Q_range = np.linspace(0, Q_ref * 1.2, 100)
-
-    # Polynomial fan curve: P = P_shutoff - k*Q²
-    # At design point: P_ref = P_shutoff - k*Q_ref²
-    # At free delivery: P = 0, Q = Q_max
-    # Assume Q_max = 1.3 * Q_ref (typical for centrifugal fans)
-    Q_max_base = Q_ref * 1.3
-
-    # Calculate coefficients with protection against division by zero
-    ratio_squared = (Q_ref / Q_max_base) ** 2
-    if ratio_squared >= 0.99:  # Protection: if Q_ref too close to Q_max
-        raise ValueError(f"Q_ref ({Q_ref}) too close to Q_max ({Q_max_base}). Adjust Q_max multiplier.")
-
-    P_shutoff_base = P_ref / (1 - ratio_squared)
-    k = P_shutoff_base / (Q_max_base ** 2)
-
-    # Base pressure curve at reference RPM
-    P_base = P_shutoff_base - k * Q_range ** 2
-    P_base[P_base < 0] = 0  # No negative pressure
-
-    # Apply affinity laws for actual RPM
-    rpm_ratio = rpm / base_rpm
-    Q_actual = Q_range * rpm_ratio
-    P_actual = P_base * (rpm_ratio ** 2)
-
-    # Efficiency curve (parabolic, peaks around 70% of Q_max)
-    Q_peak_eff = Q_ref * 0.95  # Peak efficiency near design point
-    eff_peak = 85.0  # Peak efficiency
-
-    # Gaussian-like efficiency curve
-    efficiency = eff_peak * np.exp(-((Q_range - Q_peak_eff) ** 2) / (2 * (Q_peak_eff * 0.4) ** 2))
-    efficiency = efficiency * rpm_ratio ** 0.1  # Slight efficiency loss at lower RPM
-    efficiency = np.clip(efficiency, 0, 90)  # Cap at realistic values
+    Q_curves, P_curves, eff_curves = generate_fan_curves([rpm], base_rpm)
+    Q_actual, P_actual, efficiency = Q_curves[0], P_curves[0], eff_curves[0]
+
+    # Cached arrays are shared - protect them against in-place modification
+    for arr in (Q_actual, P_actual, efficiency):
+        arr.setflags(write=False)
 
     return Q_actual, P_actual, efficiency
 
 
+# Spacing of the uniform base flow grid (_Q_RANGE_BASE is a linspace)
+_DQ_BASE = _Q_RANGE_BASE[1] - _Q_RANGE_BASE[0]
+
+def _interp_fan_curve(flow_m3h, rpm, values, base_rpm=1500):
+    """
+    Linearly interpolate a curve from generate_fan_curve(rpm) at a single flow,
+    clamped to the curve end points (same result as np.interp). `values` are
+    the curve samples, one per point of the base flow grid.
+
+    Every curve's flow axis is the uniform base grid scaled by rpm/base_rpm,
+    so the bracketing index is found in O(1) by dividing the normalized flow
+    by the grid spacing instead of searching the array.
+    """
+    x = flow_m3h / (rpm / base_rpm) / _DQ_BASE
+    last = len(values) - 1
+    if x <= 0:
+        return values[0]
+    if x >= last:
+        return values[last]
+
+    i = int(x)
+    t = x - i
+    return values[i] + t * (values[i + 1] - values[i])
+
+def _interp_fan_curves(flow_m3h, rpms, values, base_rpm=1500):
+    """
+    _interp_fan_curve() for several RPM curves at once: `values` has one row
+    per entry of `rpms` (as returned by generate_fan_curves). `flow_m3h` is a
+    single flow or an array of flows; the result has shape
+    (len(rpms),) + np.shape(flow_m3h), row i interpolated on curve i.
+    """
+    flow = np.asarray(flow_m3h, dtype=float)
+    # Per-curve RPM ratio, broadcast against the query flows
+    ratio = (np.asarray(rpms, dtype=float) / base_rpm).reshape((-1,) + (1,) * flow.ndim)
+    x = flow / ratio / _DQ_BASE
+    last = values.shape[1] - 1
+    rows = np.arange(values.shape[0]).reshape(ratio.shape)
+
+    i = np.clip(x.astype(int), 0, last - 1)
+    t = x - i
+    interpolated = values[rows, i] + t * (values[rows, i + 1] - values[rows, i])
+    return np.where(x <= 0, values[rows, 0],
+                    np.where(x >= last, values[rows, last], interpolated))
+
+
+# RPM grid for efficiency interpolation - every 100 RPM for smooth interpolation
+_RPM_GRID = np.arange(1000, 1600, 100)
+# Efficiency curves of all grid RPMs, precomputed once in a single broadcast
+_, _, _EFF_STACK = generate_fan_curves(_RPM_GRID)  # (6, 100)
+_EFF_STACK.setflags(write=False)
+# Plain-float copy of the grid for scalar bisection (avoids numpy dispatch)
+_RPM_GRID_VALUES = tuple(float(r) for r in _RPM_GRID)
+
+
+@functools.lru_cache(maxsize=256)
 def estimate_rpm_from_operating_point(flow_m3h, pressure_mbar, base_rpm=1500):
     """
     Estimate the RPM required to achieve a given flow and pressure
-    using affinity laws and the base fan curve
+    using affinity laws and the base fan curve (cached per operating point)
 
     Args:
         flow_m3h: Target flow rate in m³/h
@@ -207,15 +327,10 @@ def estimate_rpm_from_operating_point(flow_m3h, pressure_mbar, base_rpm=1500):
     """
     # Use affinity laws: P ∝ (N/N_ref)² and Q ∝ (N/N_ref)
     # At base RPM, get the pressure at this flow rate
-    Q_base, P_base, _ = generate_fan_curve(base_rpm)
+    _, P_base, _ = generate_fan_curve(base_rpm)
 
     # Interpolate pressure at target flow on base curve
-    if flow_m3h < Q_base[0]:
-        pressure_at_base_rpm = P_base[0]
-    elif flow_m3h > Q_base[-1]:
-        pressure_at_base_rpm = P_base[-1]
-    else:
-        pressure_at_base_rpm = np.interp(flow_m3h, Q_base, P_base)
+    pressure_at_base_rpm = _interp_fan_curve(flow_m3h, base_rpm, P_base)
 
     # Affinity law: P_target / P_base = (N_target / N_base)²
     # Therefore: N_target = N_base * sqrt(P_target / P_base)
@@ -231,12 +346,15 @@ def estimate_rpm_from_operating_point(flow_m3h, pressure_mbar, base_rpm=1500):
     return rpm_estimated
 
 
+@functools.lru_cache(maxsize=256)
 def get_fan_efficiency_at_operating_point(flow_m3h, pressure_mbar):
     """
     Smoothly interpolate fan efficiency at a given operating point (flow, pressure)
     using bilinear interpolation across flow and RPM dimensions.
 
     This eliminates discontinuities caused by discrete RPM curve selection.
+    Results are cached: the operating-profile points are looked up with the
+    same (flow, pressure) for every design margin.
 
     Args:
         flow_m3h: Volumetric flow rate in m³/h
@@ -248,34 +366,17 @@ def get_fan_efficiency_at_operating_point(flow_m3h, pressure_mbar):
     # Step 1: Estimate the RPM required for this operating point
     rpm_required = estimate_rpm_from_operating_point(flow_m3h, pressure_mbar)
 
-    # Step 2: Define a finer RPM grid for interpolation
-    rpm_grid = np.arange(1000, 1600, 100)  # Every 100 RPM for smooth interpolation
-
-    # Find bounding RPMs
-    rpm_lower_idx = np.searchsorted(rpm_grid, rpm_required) - 1
-    rpm_lower_idx = max(0, min(rpm_lower_idx, len(rpm_grid) - 2))
+    # Step 2: Find bounding RPMs on the fixed interpolation grid
+    rpm_lower_idx = bisect.bisect_left(_RPM_GRID_VALUES, rpm_required) - 1
+    rpm_lower_idx = max(0, min(rpm_lower_idx, len(_RPM_GRID_VALUES) - 2))
 
-    rpm_lower = rpm_grid[rpm_lower_idx]
-    rpm_upper = rpm_grid[rpm_lower_idx + 1]
+    rpm_lower = _RPM_GRID_VALUES[rpm_lower_idx]
+    rpm_upper = _RPM_GRID_VALUES[rpm_lower_idx + 1]
 
-    # Step 3: Generate curves at both bounding RPMs
-    Q_lower, P_lower, eff_lower = generate_fan_curve(rpm_lower)
-    Q_upper, P_upper, eff_upper = generate_fan_curve(rpm_upper)
-
-    # Step 4: Interpolate efficiency at target flow on both curves
-    if flow_m3h < Q_lower[0]:
-        eff_at_lower_rpm = eff_lower[0]
-    elif flow_m3h > Q_lower[-1]:
-        eff_at_lower_rpm = eff_lower[-1]
-    else:
-        eff_at_lower_rpm = np.interp(flow_m3h, Q_lower, eff_lower)
-
-    if flow_m3h < Q_upper[0]:
-        eff_at_upper_rpm = eff_upper[0]
-    elif flow_m3h > Q_upper[-1]:
-        eff_at_upper_rpm = eff_upper[-1]
-    else:
-        eff_at_upper_rpm = np.interp(flow_m3h, Q_upper, eff_upper)
+    # Steps 3-4: Interpolate efficiency at target flow on both bounding curves
+    # (precomputed grid curves - no curve generation at runtime)
+    eff_at_lower_rpm = _interp_fan_curve(flow_m3h, rpm_lower, _EFF_STACK[rpm_lower_idx])
+    eff_at_upper_rpm = _interp_fan_curve(flow_m3h, rpm_upper, _EFF_STACK[rpm_lower_idx + 1])
 
     # Step 5: Interpolate between the two RPM curves
     if rpm_lower == rpm_upper or abs(rpm_required - rpm_lower) < 1:
@@ -296,6 +397,25 @@ def get_fan_efficiency_at_operating_point(flow_m3h, pressure_mbar):
 # MOTOR EFFICIENCY CURVE
 # ============================================================================
 
+def _as_float_array(values):
+    """Return values as an at-least-1-D float64 array, without copying float64 arrays"""
+    if isinstance(values, np.ndarray) and values.dtype == np.float64 and values.ndim > 0:
+        return values
+    return np.atleast_1d(np.asarray(values, dtype=float))
+
+def _motor_efficiency_scalar(load):
+    """Scalar motor efficiency using plain floats (see motor_efficiency_curve)"""
+    if load < 25:
+        return 0.60 + 0.0072 * load
+    elif load < 50:
+        return 0.78 + 0.0048 * (load - 25)
+    elif load < 75:
+        return 0.90 + 0.0020 * (load - 50)
+    elif load <= 100:
+        return 0.95 + 0.0004 * (load - 75)
+    else:
+        return max(0.96 - 0.001 * (load - 100), 0.85)
+
 def motor_efficiency_curve(load_percent):
     """
     Calculate motor efficiency as function of load percentage
@@ -304,56 +424,56 @@ def motor_efficiency_curve(load_percent):
     Peak efficiency occurs around 75-85% load, then plateaus or slightly decreases.
     Efficiency drops significantly below 50% load.
     """
-    # Convert to array if single value
-    load = np.atleast_1d(load_percent)
+    # Fast path: scalar calls (operating-point loop) avoid numpy array overhead
+    if isinstance(load_percent, (int, float, np.number)):
+        return _motor_efficiency_scalar(float(load_percent))
+
+    # Convert to a float array (float64 arrays are used as-is, without a copy)
+    load = _as_float_array(load_percent)
 
     # Typical efficiency curve (peaks around 75-85% load)
-    eff = np.zeros_like(load)
-
-    for i, L in enumerate(load):
-        if L < 25:
-            # Very poor efficiency at low loads (25% load = ~78%)
-            eff[i] = 0.60 + 0.0072 * L
-        elif L < 50:
-            # Improving efficiency (50% load = ~90%)
-            eff[i] = 0.78 + 0.0048 * (L - 25)
-        elif L < 75:
-            # Approaching peak (75% load = ~95%)
-            eff[i] = 0.90 + 0.0020 * (L - 50)
-        elif L <= 100:
-            # Peak efficiency region - plateau at ~95-96%
-            # Efficiency plateaus, doesn't continue rising
-            eff[i] = 0.95 + 0.0004 * (L - 75)
-        else:
-            # Overload region (efficiency decreases)
-            eff[i] = max(0.96 - 0.001 * (L - 100), 0.85)
+    # Piecewise-linear segments evaluated for the whole array at once
+    conditions = [
+        load < 25,    # Very poor efficiency at low loads (25% load = ~78%)
+        load < 50,    # Improving efficiency (50% load = ~90%)
+        load < 75,    # Approaching peak (75% load = ~95%)
+        load <= 100,  # Peak efficiency region - plateau at ~95-96%
+    ]
+    choices = [
+        0.60 + 0.0072 * load,
+        0.78 + 0.0048 * (load - 25),
+        0.90 + 0.0020 * (load - 50),
+        0.95 + 0.0004 * (load - 75),  # Efficiency plateaus, doesn't continue rising
+    ]
+    # Overload region (efficiency decreases)
+    eff = np.select(conditions, choices, default=np.maximum(0.96 - 0.001 * (load - 100), 0.85))
 
     return eff if isinstance(load_percent, np.ndarray) else eff[0]
 
-def vfd_efficiency_curve(load_percent, speed_percent=None):
-    """
-    Calculate VFD efficiency as function of load percentage
-    VFD efficiency typically: 97-98% at full load, drops at part load
-    If speed_percent is provided, accounts for speed-dependent losses
+def _vfd_efficiency_scalar(load, speed):
+    """Scalar VFD efficiency using plain floats (see vfd_efficiency_curve)"""
+    if speed is None:
+        # Real cube root (matches np.cbrt in the array path for negative loads)
+        ratio = load / 100
+        speed = math.copysign(abs(ratio) ** (1/3), ratio)
+    if speed > 1.5:
+        speed = speed / 100
 
-    Args:
-        load_percent: Motor load as percentage (0-100+) - scalar, list, or numpy array
-        speed_percent: Speed as fraction (0-1.0), optional. If None, estimated from load.
+    speed_factor = 0.98 - 0.00012 * (100 - speed * 100)
+    load_factor = 0.99 - 0.003 * (30 - load) if load < 30 else 1.0
 
-    Returns:
-        VFD efficiency as fraction (0.90-0.98) - same type as input
-    """
-    # Store original type for return
-    input_is_scalar = isinstance(load_percent, (int, float, np.number))
+    return min(max(0.98 * speed_factor * load_factor, 0.90), 0.98)
 
+def _vfd_efficiency_array(load_percent, speed_percent):
+    """Vectorized VFD efficiency; always returns an ndarray (see vfd_efficiency_curve)"""
     # Convert to numpy array for vectorized operations
-    load = np.atleast_1d(np.asarray(load_percent, dtype=float))
+    load = _as_float_array(load_percent)
 
     if speed_percent is None:
         # Estimate speed from load (assuming cubic relationship: P ∝ N³)
-        speed_percent = (load / 100) ** (1/3)
+        speed_percent = np.cbrt(load / 100)
     else:
-        speed_percent = np.atleast_1d(np.asarray(speed_percent, dtype=float))
+        speed_percent = _as_float_array(speed_percent)
 
     # Ensure speed_percent is in 0-1 range (convert from % if needed)
     if np.any(speed_percent > 1.5):
@@ -367,17 +487,53 @@ def vfd_efficiency_curve(load_percent, speed_percent=None):
     speed_factor = 0.98 - 0.00012 * (100 - speed_percent * 100)
 
     # Efficiency also drops slightly at very low loads (<30%)
-    load_factor = np.ones_like(load)
-    load_factor[load < 30] = 0.99 - 0.003 * (30 - load[load < 30])
+    load_factor = np.where(load < 30, 0.99 - 0.003 * (30 - load), 1.0)
 
-    eff = eff_base * speed_factor * load_factor
-    eff = np.clip(eff, 0.90, 0.98)  # Realistic range
+    # Combine and clip in place on the fresh speed-factor temporary
+    speed_factor *= eff_base
+    eff = np.multiply(speed_factor, load_factor)
+    np.clip(eff, 0.90, 0.98, out=eff)  # Realistic range
 
-    # Return same type as input
-    if input_is_scalar:
-        return float(eff[0])
-    else:
-        return eff
+    return eff
+
+def vfd_efficiency_curve(load_percent, speed_percent=None):
+    """
+    Calculate VFD efficiency as function of load percentage
+    VFD efficiency typically: 97-98% at full load, drops at part load
+    If speed_percent is provided, accounts for speed-dependent losses
+
+    Args:
+        load_percent: Motor load as percentage (0-100+) - scalar, list, or numpy array
+        speed_percent: Speed as fraction (0-1.0), optional. If None, estimated from load.
+
+    Returns:
+        VFD efficiency as fraction (0.90-0.98) - same type as input
+    """
+    # Dispatch once on the input type; each path returns its own type
+    if not isinstance(load_percent, (int, float, np.number)):
+        return _vfd_efficiency_array(load_percent, speed_percent)
+
+    # Fast path: scalar calls (operating-point loop) avoid numpy array overhead
+    if speed_percent is None or isinstance(speed_percent, (int, float, np.number)):
+        return _vfd_efficiency_scalar(float(load_percent),
+                                      None if speed_percent is None else float(speed_percent))
+
+    # Scalar load with array of speeds: first entry, as a float
+    return float(_vfd_efficiency_array(load_percent, speed_percent)[0])
+
+def drive_efficiency_curves(load_percent):
+    """
+    Motor, VFD and combined drive efficiency over a load range in one call.
+    VFD speed is estimated from load inside vfd_efficiency_curve (P ∝ N³), so
+    no separate speed array is built.
+
+    Returns:
+        (motor_eff, vfd_eff, combined_eff) as fractions
+    """
+    load = _as_float_array(load_percent)
+    motor_eff = motor_efficiency_curve(load)
+    vfd_eff = vfd_efficiency_curve(load)
+    return motor_eff, vfd_eff, motor_eff * vfd_eff
 
 def calculate_system_pressure(flow_m3h, flow_ref=None, pressure_ref=None):
     """
@@ -385,209 +541,351 @@ def calculate_system_pressure(flow_m3h, flow_ref=None, pressure_ref=None):
     P_system = P_static + k * Q^2
     If flow_ref and pressure_ref are provided, calculates from reference point
     Otherwise uses global system parameters
+    Array flows are evaluated in one pass (see calculate_system_pressure_vec)
     """
+    if isinstance(flow_m3h, np.ndarray):
+        return calculate_system_pressure_vec(flow_m3h, flow_ref, pressure_ref)
+
     if flow_ref is None:
         flow_ref = flow_cclpa
     if pressure_ref is None:
         pressure_ref = pressure_cclpa
     
     # Calculate dynamic coefficient from reference point
-    k_dynamic = (pressure_ref - system_static_pressure) / (flow_ref ** 2)
+    k_dynamic = (pressure_ref - system_static_pressure) / (flow_ref * flow_ref)
     
     # Calculate pressure at requested flow
-    pressure = system_static_pressure + k_dynamic * (flow_m3h ** 2)
+    pressure = system_static_pressure + k_dynamic * (flow_m3h * flow_m3h)
     
     return max(pressure, 0)  # No negative pressure
 
+def calculate_system_pressure_vec(flow_m3h, flow_ref=None, pressure_ref=None):
+    """
+    Vectorized calculate_system_pressure() for an array of flow rates
+    Returns an array of system pressures (mbar), one per flow
+    """
+    if flow_ref is None:
+        flow_ref = flow_cclpa
+    if pressure_ref is None:
+        pressure_ref = pressure_cclpa
+
+    flow_m3h = np.asarray(flow_m3h, dtype=float)
+    k_dynamic = (pressure_ref - system_static_pressure) / (flow_ref * flow_ref)
+    pressure = system_static_pressure + k_dynamic * (flow_m3h * flow_m3h)
+
+    return np.maximum(pressure, 0)  # No negative pressure
+
 # ============================================================================
 # COST CALCULATION FUNCTIONS
 # ============================================================================
 
+def escalated_annuity_factor(escalation, discount, years):
+    """
+    Present value of a cost of 1 €/year over years 1..N that escalates at
+    `escalation` and is discounted at `discount` (closed-form geometric sum):
+        sum_{y=1..N} r**y = r * (r**N - 1) / (r - 1),  r = (1 + escalation) / (1 + discount)
+    """
+    r = (1 + escalation) / (1 + discount)
+    if abs(r - 1) < 1e-12:  # Escalation equals discount: every year counts once
+        return float(years)
+    return r * (r ** years - 1) / (r - 1)
+
+# NPV multipliers applied to first-year-basis annual costs (constant inputs)
+_NPV_ENERGY_FACTOR = escalated_annuity_factor(electricity_escalation, discount_rate, plant_lifetime)
+_NPV_MAINT_FACTOR = escalated_annuity_factor(maintenance_escalation, discount_rate, plant_lifetime)
+
+# Fan power unit conversion: (m³/h / 3600) * (mbar * 100) / (eff% / 100) / 1000
+#   = m³/h * mbar / eff% / 360  ->  kW
+_FAN_POWER_K = 1.0 / 360
+
 def calculate_fan_power(flow_m3h, pressure_mbar, efficiency_pct):
-    """Calculate fan shaft power in kW"""
-    flow_m3s = flow_m3h / 3600
-    pressure_pa = pressure_mbar * 100
-    efficiency_frac = efficiency_pct / 100
-    power_kw = (flow_m3s * pressure_pa) / (efficiency_frac * 1000)
-    return power_kw
+    """
+    Calculate fan shaft power in kW
+    Works elementwise (with broadcasting) on numpy arrays as well as scalars.
+    """
+    return flow_m3h * pressure_mbar * _FAN_POWER_K / efficiency_pct
+
+# Fan efficiency and shaft power at the fixed operating points do not depend on
+# the design margin - evaluate them once from the actual fan curves.
+# (Design-point efficiencies vary with the margin and are looked up per call,
+# served by the get_fan_efficiency_at_operating_point cache on repeats.)
+_profile_effs = np.array([get_fan_efficiency_at_operating_point(flow_op, pressure_op)
+                          for flow_op, pressure_op in zip(_profile_flows, _profile_pressures)])
+_profile_fan_power_kw = calculate_fan_power(_profile_flows, _profile_pressures, _profile_effs)
+_nominal_fan_power_kw = calculate_fan_power(
+    flow_cclpa, pressure_cclpa, get_fan_efficiency_at_operating_point(flow_cclpa, pressure_cclpa))
+
+# Lifecycle cost result record: fixed fields instead of a dict of string keys.
+# calculate_lifecycle_cost() returns one with float fields; the batch and sweep
+# functions return one whose fields are arrays with one entry per margin.
+# use_part_load_profile records which energy model produced the values.
+LifecycleResult = namedtuple('LifecycleResult', [
+    'design_margin_pct',
+    'flow_design',
+    'pressure_design',
+    'motor_rated_kw',
+    'motor_load_pct',
+    'motor_efficiency',
+    'motor_input_kw',
+    'annual_energy_kwh',
+    'annual_opex_energy_eur',
+    'annual_maintenance_eur',
+    'annual_opex_eur',
+    'annual_co2_tons',
+    'capex_eur',
+    'npv_opex_eur',
+    'total_lifecycle_cost',
+    'use_part_load_profile',
+])
+
+# Per-margin value fields (everything except the profile flag)
+_LIFECYCLE_ARRAY_FIELDS = LifecycleResult._fields[:-1]
+
+def _part_load_energy(motor_rated, flow_design_case):
+    """
+    Annual energy over the operating profile for arrays of design cases
+    Returns: (annual_energy_kwh, avg_motor_load_pct, avg_motor_eff), one entry per case
+    """
+    flows_op = _profile_flows
+    hours_op = _profile_hours
 
-def calculate_lifecycle_cost(design_margin_pct, verbose=False, use_part_load_profile=True):
+    # Fan power at each operating point (independent of design margin)
+    power_fan_op = _profile_fan_power_kw
+
+    # Motor load percentage - shape (n_margins, n_points)
+    motor_load_pct_op = (power_fan_op[None, :] / motor_rated[:, None]) * 100
+
+    # Motor efficiency
+    motor_eff_op = motor_efficiency_curve(motor_load_pct_op)
+
+    # Estimate speed percentage from flow ratio
+    # Per affinity laws: Flow varies linearly with speed (Q ∝ N)
+    # Therefore: N/N_design = Q/Q_design
+    speed_pct_op = (flows_op[None, :] / flow_design_case[:, None]) * 100
+
+    # VFD efficiency
+    vfd_eff_op = vfd_efficiency_curve(motor_load_pct_op, speed_pct_op/100)
+
+    # Motor input power: the (n_margins, n_points) drive efficiency product is
+    # formed once, in the VFD buffer, and divided into in place
+    drive_eff_op = np.multiply(motor_eff_op, vfd_eff_op, out=vfd_eff_op)
+    motor_input_power_op = np.divide(power_fan_op, drive_eff_op, out=drive_eff_op)
+
+    # Energy consumption summed over operating points (hours-weighted sum)
+    annual_energy_kwh = motor_input_power_op @ hours_op
+
+    # Average motor load for reporting (weighted by operating hours)
+    avg_motor_load_pct = motor_load_pct_op @ _profile_time_fractions
+    avg_motor_eff = motor_efficiency_curve(avg_motor_load_pct)
+
+    return annual_energy_kwh, avg_motor_load_pct, avg_motor_eff
+
+def _nominal_energy(motor_rated, flow_design_case):
     """
-    Calculate total lifecycle cost for a given design margin
-    design_margin_pct: percentage above nominal (e.g., 15 for API 560)
+    Annual energy assuming 100% operation at nominal (original method)
+    Returns: (annual_energy_kwh, motor_load_pct, motor_eff), one entry per case
+    """
+    # Get fan efficiency from actual curves at nominal operating point
+    power_fan_nominal = _nominal_fan_power_kw
+    motor_load_pct = (power_fan_nominal / motor_rated) * 100
+    motor_eff = motor_efficiency_curve(motor_load_pct)
+    # Speed ratio: Flow varies linearly with speed (affinity law)
+    speed_pct_nominal = (flow_cclpa / flow_design_case) * 100
+    vfd_eff = vfd_efficiency_curve(motor_load_pct, speed_pct_nominal/100)
+    motor_input_power = power_fan_nominal / (motor_eff * vfd_eff)
+    annual_energy_kwh = motor_input_power * operating_hours
+    # Single operating point: reporting values are the nominal ones
+    return annual_energy_kwh, motor_load_pct, motor_eff
+
+def calculate_lifecycle_cost_batch(design_margins_pct, use_part_load_profile=True):
+    """
+    Calculate lifecycle cost components for an array of design margins at once
+    design_margins_pct: sequence of percentages above nominal (e.g., [10, 15, 32])
     use_part_load_profile: if True, uses operating profile; if False, assumes 100% at nominal
-    Returns: dict with all cost components
+    Returns: LifecycleResult whose fields are arrays with one entry per margin
+
+    Per-margin quantities are arrays of shape (n_margins,); operating-profile
+    quantities are broadcast to (n_margins, n_points) and summed over points.
     """
+    margins = np.atleast_1d(np.asarray(design_margins_pct, dtype=float))
+
     # Design flow based on margin over nominal
-    flow_design_case = flow_cclpa * (1 + design_margin_pct / 100)
+    flow_design_case = flow_cclpa * (1 + margins / 100)
 
     # Estimate pressure rise using improved system curve
-    pressure_design_case = calculate_system_pressure(flow_design_case, flow_cclpa, pressure_cclpa)
+    pressure_design_case = calculate_system_pressure_vec(flow_design_case, flow_cclpa, pressure_cclpa)
 
-    # Get efficiency from actual fan curves at design point
-    eff_design = get_fan_efficiency_at_operating_point(flow_design_case, pressure_design_case)
+    # Get efficiency from actual fan curves at each design point (curve lookups are per point)
+    eff_design = np.array([get_fan_efficiency_at_operating_point(q, p)
+                           for q, p in zip(flow_design_case, pressure_design_case)])
 
     # Fan power at design point
     power_fan_design = calculate_fan_power(flow_design_case, pressure_design_case, eff_design)
-    
+
     # Motor sizing
     motor_margin = 1.10
     motor_rated = power_fan_design * motor_margin
-    
+
     # CAPEX (motor and VFD cost)
     capex = motor_rated * motor_cost_per_kw
-    
-    # Calculate energy consumption based on operating profile
-    if use_part_load_profile:
-        annual_energy_kwh = 0
-        annual_opex_energy = 0
-        # Store motor load data to avoid duplicate calculations later
-        motor_load_data = []
-
-        for op_point in operating_profile.values():
-            flow_op = op_point['flow']
-            pressure_op = op_point['pressure']
-            hours = op_point['hours_per_year']
-
-            # Get fan efficiency from actual fan curves at this operating point
-            eff_op = get_fan_efficiency_at_operating_point(flow_op, pressure_op)
-
-            # Fan power at this operating point
-            power_fan_op = calculate_fan_power(flow_op, pressure_op, eff_op)
-
-            # Motor load percentage
-            motor_load_pct_op = (power_fan_op / motor_rated) * 100
-
-            # Store for weighted average calculation (avoid duplicate calculation)
-            motor_load_data.append({
-                'motor_load_pct': motor_load_pct_op,
-                'hours': hours
-            })
-
-            # Motor efficiency
-            motor_eff_op = motor_efficiency_curve(motor_load_pct_op)
 
-            # Estimate speed percentage from flow ratio
-            # Per affinity laws: Flow varies linearly with speed (Q ∝ N)
-            # Therefore: N/N_design = Q/Q_design
-            speed_pct_op = (flow_op / flow_design_case) * 100
+    # Energy consumption: the profile choice selects a specialized model
+    energy_model = _part_load_energy if use_part_load_profile else _nominal_energy
+    annual_energy_kwh, avg_motor_load_pct, avg_motor_eff = energy_model(motor_rated, flow_design_case)
 
-            # VFD efficiency
-            vfd_eff_op = vfd_efficiency_curve(motor_load_pct_op, speed_pct_op/100)
+    # Annual operating cost (energy only, maintenance added separately)
+    annual_opex_energy = annual_energy_kwh * electricity_cost
 
-            # Total system efficiency (fan × motor × VFD)
-            total_eff_op = (eff_op / 100) * motor_eff_op * vfd_eff_op
-
-            # Motor input power
-            motor_input_power_op = power_fan_op / (motor_eff_op * vfd_eff_op)
-
-            # Energy consumption at this operating point
-            energy_op = motor_input_power_op * hours
-            annual_energy_kwh += energy_op
-
-        # Annual operating cost (energy only, maintenance added separately)
-        annual_opex_energy = annual_energy_kwh * electricity_cost
-        
-    else:
-        # Original method: assume 100% operation at nominal
-        # Get fan efficiency from actual curves at nominal operating point
-        eff_nominal = get_fan_efficiency_at_operating_point(flow_cclpa, pressure_cclpa)
-        power_fan_nominal = calculate_fan_power(flow_cclpa, pressure_cclpa, eff_nominal)
-        motor_load_pct = (power_fan_nominal / motor_rated) * 100
-        motor_eff = motor_efficiency_curve(motor_load_pct)
-        # Speed ratio: Flow varies linearly with speed (affinity law)
-        speed_pct_nominal = (flow_cclpa / flow_design_case) * 100
-        vfd_eff = vfd_efficiency_curve(motor_load_pct, speed_pct_nominal/100)
-        motor_input_power = power_fan_nominal / (motor_eff * vfd_eff)
-        annual_energy_kwh = motor_input_power * operating_hours
-        annual_opex_energy = annual_energy_kwh * electricity_cost
-        motor_load_pct_op = motor_load_pct
-    
     # Maintenance costs (annual)
     annual_maintenance = capex * maintenance_cost_rate
-    
+
     # Total annual OPEX (energy + maintenance)
     annual_opex = annual_opex_energy + annual_maintenance
-    
+
     # NPV of OPEX over lifetime
-    npv_opex = 0
-    for year in range(1, plant_lifetime + 1):
-        # Energy cost escalates
-        annual_energy_cost = annual_opex_energy * ((1 + electricity_escalation) ** year)
-        # Maintenance cost escalates with inflation (assume 2%)
-        annual_maint_cost = annual_maintenance * ((1.02) ** year)
-        annual_cost = annual_energy_cost + annual_maint_cost
-        discounted_cost = annual_cost / ((1 + discount_rate) ** year)
-        npv_opex += discounted_cost
-    
+    # Energy cost escalates with electricity prices, maintenance with inflation
+    npv_opex = annual_opex_energy * _NPV_ENERGY_FACTOR + annual_maintenance * _NPV_MAINT_FACTOR
+
     # CO2 emissions
     annual_co2_tons = annual_energy_kwh * co2_intensity / 1000
-    
+
     # Total lifecycle cost
     total_lifecycle_cost = capex + npv_opex
-    
-    # Calculate average motor load for reporting (weighted by operating hours)
-    if use_part_load_profile:
-        # Use previously calculated motor load data (no duplicate calculation)
-        total_hours = sum(data['hours'] for data in motor_load_data)
-        weighted_load = sum(data['motor_load_pct'] * data['hours'] / total_hours
-                           for data in motor_load_data)
-        avg_motor_load_pct = weighted_load
-        avg_motor_eff = motor_efficiency_curve(avg_motor_load_pct)
-    else:
-        avg_motor_load_pct = motor_load_pct_op
-        avg_motor_eff = motor_efficiency_curve(avg_motor_load_pct)
-    
+
+    return LifecycleResult(
+        design_margin_pct=margins,
+        flow_design=flow_design_case,
+        pressure_design=pressure_design_case,
+        motor_rated_kw=motor_rated,
+        motor_load_pct=avg_motor_load_pct,
+        motor_efficiency=avg_motor_eff,
+        motor_input_kw=annual_energy_kwh / operating_hours,  # Average input power
+        annual_energy_kwh=annual_energy_kwh,
+        annual_opex_energy_eur=annual_opex_energy,
+        annual_maintenance_eur=annual_maintenance,
+        annual_opex_eur=annual_opex,
+        annual_co2_tons=annual_co2_tons,
+        capex_eur=capex,
+        npv_opex_eur=npv_opex,
+        total_lifecycle_cost=total_lifecycle_cost,
+        use_part_load_profile=bool(use_part_load_profile),
+    )
+
+def _lifecycle_result_row(batch_results, index, design_margin_pct):
+    """Extract one margin's result (scalar fields) from batch results"""
+    row = {name: float(getattr(batch_results, name)[index]) for name in _LIFECYCLE_ARRAY_FIELDS}
+    row['design_margin_pct'] = design_margin_pct
+    return batch_results._replace(**row)
+
+# Memoized single-margin results keyed by (margin rounded to 0.001 %, profile flag)
+_lifecycle_cache = {}
+
+def _lifecycle_cache_key(design_margin_pct, use_part_load_profile):
+    return round(float(design_margin_pct), 3), bool(use_part_load_profile)
+
+def _sweep_row(sweep, design_margin_pct):
+    """Result for a margin from sensitivity_analysis() arrays, or None if not swept"""
+    hits = np.flatnonzero(sweep.design_margin_pct == design_margin_pct)
+    if not hits.size:
+        return None
+    index = hits[0]
+    return _lifecycle_result_row(sweep, index, sweep.design_margin_pct[index])
+
+def print_lifecycle_cost(result):
+    """Print the cost breakdown of one calculate_lifecycle_cost() result"""
+    print(f"\nDesign Margin: {result.design_margin_pct}%")
+    print(f"  Motor Rated: {result.motor_rated_kw:.1f} kW")
+    print(f"  Avg Motor Load: {result.motor_load_pct:.1f}%")
+    print(f"  Avg Motor Efficiency: {result.motor_efficiency*100:.1f}%")
+    print(f"  Annual Energy: {result.annual_energy_kwh:,.0f} kWh")
+    print(f"  Annual Energy Cost: €{result.annual_opex_energy_eur:,.0f}")
+    print(f"  Annual Maintenance: €{result.annual_maintenance_eur:,.0f}")
+    print(f"  Annual OPEX: €{result.annual_opex_eur:,.0f}")
+    print(f"  CAPEX: €{result.capex_eur:,.0f}")
+    print(f"  NPV OPEX (30yr): €{result.npv_opex_eur:,.0f}")
+    print(f"  Total Lifecycle: €{result.total_lifecycle_cost:,.0f}")
+
+def calculate_lifecycle_cost(design_margin_pct, verbose=False, use_part_load_profile=True):
+    """
+    Calculate total lifecycle cost for a given design margin
+    design_margin_pct: percentage above nominal (e.g., 15 for API 560)
+    use_part_load_profile: if True, uses operating profile; if False, assumes 100% at nominal
+    Returns: LifecycleResult with all cost components
+
+    Results are memoized per (margin rounded to 0.001 %, profile flag); the
+    plots and summary table evaluate the same margins repeatedly.
+    """
+    key = _lifecycle_cache_key(design_margin_pct, use_part_load_profile)
+    cached = _lifecycle_cache.get(key)
+    if cached is None:
+        batch_results = calculate_lifecycle_cost_batch([key[0]], key[1])
+        cached = _lifecycle_result_row(batch_results, 0, key[0])
+        _lifecycle_cache[key] = cached
+    # Results are immutable, so the cached record is shared, not copied
+    result = cached._replace(design_margin_pct=design_margin_pct)
+
     if verbose:
-        print(f"\nDesign Margin: {design_margin_pct}%")
-        print(f"  Motor Rated: {motor_rated:.1f} kW")
-        print(f"  Avg Motor Load: {avg_motor_load_pct:.1f}%")
-        print(f"  Avg Motor Efficiency: {avg_motor_eff*100:.1f}%")
-        print(f"  Annual Energy: {annual_energy_kwh:,.0f} kWh")
-        print(f"  Annual Energy Cost: €{annual_opex_energy:,.0f}")
-        print(f"  Annual Maintenance: €{annual_maintenance:,.0f}")
-        print(f"  Annual OPEX: €{annual_opex:,.0f}")
-        print(f"  CAPEX: €{capex:,.0f}")
-        print(f"  NPV OPEX (30yr): €{npv_opex:,.0f}")
-        print(f"  Total Lifecycle: €{total_lifecycle_cost:,.0f}")
-    
-    return {
-        'design_margin_pct': design_margin_pct,
-        'flow_design': flow_design_case,
-        'pressure_design': pressure_design_case,
-        'motor_rated_kw': motor_rated,
-        'motor_load_pct': avg_motor_load_pct,
-        'motor_efficiency': avg_motor_eff,
-        'motor_input_kw': annual_energy_kwh / operating_hours,  # Average input power
-        'annual_energy_kwh': annual_energy_kwh,
-        'annual_opex_energy_eur': annual_opex_energy,
-        'annual_maintenance_eur': annual_maintenance,
-        'annual_opex_eur': annual_opex,
-        'annual_co2_tons': annual_co2_tons,
-        'capex_eur': capex,
-        'npv_opex_eur': npv_opex,
-        'total_lifecycle_cost': total_lifecycle_cost
-    }
+        print_lifecycle_cost(result)
+
+    return result
 
 # ============================================================================
 # SENSITIVITY ANALYSIS
 # ============================================================================
 
 def sensitivity_analysis(use_part_load_profile=True):
-    """Run sensitivity analysis over range of design margins"""
+    """
+    Run sensitivity analysis over range of design margins
+    Returns: (margins, sweep) - sweep is a LifecycleResult whose fields are
+             arrays with one entry per margin
+    """
     margins = np.arange(10, 35, 1)  # 10% to 34% in 1% steps
-    results = [calculate_lifecycle_cost(m, use_part_load_profile=use_part_load_profile) for m in margins]
-    return margins, results
+    # One vectorized pass over all margins instead of a call per margin
+    sweep = calculate_lifecycle_cost_batch(margins, use_part_load_profile=use_part_load_profile)
+    sweep = sweep._replace(design_margin_pct=margins)
+
+    return margins, sweep
+
+def _lookup_lifecycle_cost(sweep, design_margin_pct):
+    """
+    Result for a margin from sensitivity_analysis() arrays, computed on a miss
+    Misses use the sweep's operating profile (part-load if no sweep is given).
+    """
+    if sweep is None:
+        return calculate_lifecycle_cost(design_margin_pct, use_part_load_profile=True)
+    result = _sweep_row(sweep, design_margin_pct)
+    if result is not None:
+        return result
+    return calculate_lifecycle_cost(design_margin_pct,
+                                    use_part_load_profile=sweep.use_part_load_profile)
 
 # ============================================================================
 # PLOTTING FUNCTIONS
 # ============================================================================
 
-def create_comprehensive_plots():
-    """Create all visualization plots"""
+def create_comprehensive_plots(sweep=None):
+    """
+    Create all visualization plots
+    sweep: optional result arrays of sensitivity_analysis(); margins it does not
+           cover use its profile; a part-load sweep is run here if not given
+    """
+    if sweep is None:
+        _, sweep = sensitivity_analysis(use_part_load_profile=True)
     
-    fig = plt.figure(figsize=(20, 12))
-    gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
+    plt = _pyplot()
+    from matplotlib.gridspec import GridSpec
+    
+    # Constrained layout lays the figure out once while drawing, replacing
+    # tight_layout() plus a bbox_inches='tight' pass at save time
+    fig = plt.figure(figsize=(20, 12), layout='constrained')
+    gs = GridSpec(3, 3, figure=fig)
+    
+    # Current Design and API 560 (115% of CCLPA) points on the system curve,
+    # shared by plots 1 and 2
+    flow_current = flow_cclpa * (1 + CURRENT_DESIGN_MARGIN_PCT / 100)
+    pressure_current = calculate_system_pressure(flow_current, flow_cclpa, pressure_cclpa)
+    flow_api = flow_cclpa * 1.15
+    pressure_api = calculate_system_pressure(flow_api, flow_cclpa, pressure_cclpa)
     
     # ========================================================================
     # PLOT 1: Fan Performance Curves at Various RPM
@@ -597,29 +895,25 @@ def create_comprehensive_plots():
     rpm_values = [1200, 1350, 1500]
     colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
     
-    for rpm, color in zip(rpm_values, colors):
-        Q, P, eff = generate_fan_curve(rpm)
+    # All RPM curves in one broadcast - shape (len(rpm_values), n_points)
+    Q_curves, P_curves, eff_curves = generate_fan_curves(rpm_values)
+
+    for rpm, color, Q, P in zip(rpm_values, colors, Q_curves, P_curves):
         ax1.plot(Q/1000, P, color=color, linewidth=2, 
                 label=f'{rpm} RPM - Pressure', linestyle='-')
     
     # System curve overlay (for reference)
     system_flows = np.linspace(80, 220, 50) * 1000  # m³/h
-    system_pressures = [calculate_system_pressure(q, flow_cclpa, pressure_cclpa) for q in system_flows]
+    system_pressures = calculate_system_pressure_vec(system_flows, flow_cclpa, pressure_cclpa)
     ax1.plot(system_flows/1000, system_pressures, 'k--', linewidth=2, 
             alpha=0.5, label='System Curve', zorder=3)
     
-    # Current Design point
-    flow_current = flow_cclpa * (1 + CURRENT_DESIGN_MARGIN_PCT / 100)
-    pressure_current = calculate_system_pressure(flow_current, flow_cclpa, pressure_cclpa)
-    
     # Plot Current Design point
     ax1.scatter(flow_current/1000, pressure_current, s=200, c='red', 
                marker='X', edgecolors='black', linewidth=2, 
                zorder=5, label='Current Design\n(132% CCLPA)')
     
     # API 560 point (115% of CCLPA) - use consistent system curve
-    flow_api = flow_cclpa * 1.15
-    pressure_api = calculate_system_pressure(flow_api, flow_cclpa, pressure_cclpa)
     ax1.scatter(flow_api/1000, pressure_api, s=200, c='purple', 
                marker='*', edgecolors='black', linewidth=2, 
                zorder=5, label='API 560\n(115% CCLPA)')
@@ -662,55 +956,32 @@ def create_comprehensive_plots():
     # ========================================================================
     ax2 = fig.add_subplot(gs[0, 2])
     
-    # Store curves for efficiency interpolation
-    curve_data = {}
-    for rpm, color in zip(rpm_values, colors):
-        Q, P, eff = generate_fan_curve(rpm)
-        curve_data[rpm] = (Q, P, eff)
+    # Efficiency curves from the same broadcast as plot 1 (rows follow rpm_values)
+    for rpm, color, Q, eff in zip(rpm_values, colors, Q_curves, eff_curves):
         ax2.plot(Q/1000, eff, color=color, linewidth=2, 
                 label=f'{rpm} RPM')
     
-    # Helper function to interpolate efficiency at a given flow
-    def get_efficiency_at_flow(target_flow, rpm, curve_data):
-        """Interpolate efficiency at target flow rate for given RPM"""
-        Q, P, eff = curve_data[rpm]
-        # Use numpy interp for linear interpolation (Q is already sorted)
-        # Clip to valid range
-        if target_flow < Q[0]:
-            return eff[0]
-        if target_flow > Q[-1]:
-            return eff[-1]
-        return np.interp(target_flow, Q, eff)
-    
-    # Helper function to find best matching RPM curve for a given flow and pressure
-    def find_best_rpm_curve(target_flow, target_pressure, curve_data, rpm_values):
-        """Find which RPM curve a point is closest to based on pressure"""
-        best_rpm = 1200  # Default
-        min_diff = float('inf')
-        for rpm in rpm_values:
-            Q, P, eff = curve_data[rpm]
-            if target_flow >= Q[0] and target_flow <= Q[-1]:
-                pressure_at_flow = np.interp(target_flow, Q, P)
-                diff = abs(pressure_at_flow - target_pressure)
-                if diff < min_diff:
-                    min_diff = diff
-                    best_rpm = rpm
-        return best_rpm
-    
-    # Add Current Design point - determine which RPM curve it's on
-    flow_current = flow_cclpa * (1 + CURRENT_DESIGN_MARGIN_PCT / 100)
-    pressure_current = calculate_system_pressure(flow_current, flow_cclpa, pressure_cclpa)
-    best_rpm_current = find_best_rpm_curve(flow_current, pressure_current, curve_data, rpm_values)
-    eff_current = get_efficiency_at_flow(flow_current, best_rpm_current, curve_data)
+    # Helper function to find best matching RPM curve for given flows and pressures
+    def find_best_rpm_curves(target_flows, target_pressures):
+        """Index into rpm_values of the curve each point is closest to based on pressure"""
+        # Pressure of every RPM curve at every target flow - shape (n_rpms, n_points)
+        diff = np.abs(_interp_fan_curves(target_flows, rpm_values, P_curves) - target_pressures)
+        # Only curves whose flow range covers the target flow are candidates
+        diff[(target_flows < Q_curves[:, :1]) | (target_flows > Q_curves[:, -1:])] = np.inf
+        # 1200 RPM is the default for points outside every curve's range
+        return np.where(np.isinf(diff).all(axis=0), rpm_values.index(1200), np.argmin(diff, axis=0))
+    
+    # Current Design and API 560 (115% of CCLPA) points - determine which RPM
+    # curve each is on, then read the efficiency of that curve at its flow
+    point_flows = np.array([flow_current, flow_api])
+    point_pressures = np.array([pressure_current, pressure_api])
+    best_curve = find_best_rpm_curves(point_flows, point_pressures)
+    eff_current, eff_api = _interp_fan_curves(point_flows, rpm_values, eff_curves)[
+        best_curve, np.arange(len(point_flows))]
+    
     ax2.scatter(flow_current/1000, eff_current, s=200, c='red', 
                marker='X', edgecolors='black', linewidth=2, 
                zorder=5, label='Current Design\n(132% CCLPA)')
-    
-    # Add API 560 point (115% of CCLPA) - use consistent system curve
-    flow_api = flow_cclpa * 1.15
-    pressure_api = calculate_system_pressure(flow_api, flow_cclpa, pressure_cclpa)
-    best_rpm_api = find_best_rpm_curve(flow_api, pressure_api, curve_data, rpm_values)
-    eff_api = get_efficiency_at_flow(flow_api, best_rpm_api, curve_data)
     ax2.scatter(flow_api/1000, eff_api, s=200, c='purple', 
                marker='*', edgecolors='black', linewidth=2, 
                zorder=5, label='API 560\n(115% CCLPA)')
@@ -732,11 +1003,8 @@ def create_comprehensive_plots():
     ax3 = fig.add_subplot(gs[1, 0])
     
     load_range = np.linspace(0, 120, 200)
-    motor_eff = motor_efficiency_curve(load_range)
-    # VFD efficiency at various speeds (approximate speed from load)
-    speed_range = (load_range / 100) ** (1/3) * 100  # Approximate speed %
-    vfd_eff = vfd_efficiency_curve(load_range, speed_range/100)
-    combined_eff = motor_eff * vfd_eff
+    # VFD efficiency at the speed implied by load (approximate cube law)
+    motor_eff, vfd_eff, combined_eff = drive_efficiency_curves(load_range)
     
     ax3.plot(load_range, motor_eff * 100, linewidth=2, color='#d62728', 
             label='Motor Efficiency', linestyle='-')
@@ -750,16 +1018,16 @@ def create_comprehensive_plots():
     ax3.axvspan(60, 80, alpha=0.15, color='green', label='Optimal Load Range')
     
     # Mark current design operating point
-    current_results = calculate_lifecycle_cost(CURRENT_DESIGN_MARGIN_PCT, use_part_load_profile=True)
-    ax3.scatter(current_results['motor_load_pct'], 
-               current_results['motor_efficiency'] * 100,
+    current_results = _lookup_lifecycle_cost(sweep, CURRENT_DESIGN_MARGIN_PCT)
+    ax3.scatter(current_results.motor_load_pct, 
+               current_results.motor_efficiency * 100,
                s=200, c='red', marker='X', edgecolors='black', 
                linewidth=2, zorder=5, label='Current Design')
     
     # Mark API 560 operating point
-    api_results = calculate_lifecycle_cost(15, use_part_load_profile=True)
-    ax3.scatter(api_results['motor_load_pct'], 
-               api_results['motor_efficiency'] * 100,
+    api_results = _lookup_lifecycle_cost(sweep, 15)
+    ax3.scatter(api_results.motor_load_pct, 
+               api_results.motor_efficiency * 100,
                s=200, c='purple', marker='*', edgecolors='black', 
                linewidth=2, zorder=5, label='API 560')
     
@@ -776,22 +1044,22 @@ def create_comprehensive_plots():
     # ========================================================================
     ax4 = fig.add_subplot(gs[1, 1])
     
-    margins, results = sensitivity_analysis(use_part_load_profile=True)
-    total_costs = [r['total_lifecycle_cost'] for r in results]
+    margins = sweep.design_margin_pct
+    total_costs_k = sweep.total_lifecycle_cost / 1000
     
-    ax4.plot(margins, np.array(total_costs)/1000, linewidth=3, 
+    ax4.plot(margins, total_costs_k, linewidth=3, 
             color='#e377c2', marker='o', markersize=4)
     
-    # Mark key points
-    api_idx = np.argmin(np.abs(margins - 15))
-    current_idx = np.argmin(np.abs(margins - CURRENT_DESIGN_MARGIN_PCT))
+    # Indices of the key points on the sweep, shared by plots 4-7
+    api_idx = int(np.argmin(np.abs(margins - 15)))
+    current_idx = int(np.argmin(np.abs(margins - CURRENT_DESIGN_MARGIN_PCT)))
     
     # Mark API 560 point (plotted but not in legend)
-    ax4.scatter(15, total_costs[api_idx]/1000, s=300, c='purple', 
+    ax4.scatter(15, total_costs_k[api_idx], s=300, c='purple', 
                marker='*', edgecolors='black', linewidth=2, 
                zorder=5)
     # Mark Current Design point (plotted but not in legend)
-    ax4.scatter(CURRENT_DESIGN_MARGIN_PCT, total_costs[current_idx]/1000, s=250, c='red', 
+    ax4.scatter(CURRENT_DESIGN_MARGIN_PCT, total_costs_k[current_idx], s=250, c='red', 
                marker='X', edgecolors='black', linewidth=2, 
                zorder=5)
     
@@ -811,14 +1079,14 @@ def create_comprehensive_plots():
     # ========================================================================
     ax5 = fig.add_subplot(gs[1, 2])
     
-    annual_opex = [r['annual_opex_eur'] for r in results]
+    annual_opex_k = sweep.annual_opex_eur / 1000
     
-    ax5.plot(margins, np.array(annual_opex)/1000, linewidth=3, 
+    ax5.plot(margins, annual_opex_k, linewidth=3, 
             color='#bcbd22', marker='s', markersize=4)
     
-    ax5.scatter(15, annual_opex[api_idx]/1000, s=300, c='purple',
+    ax5.scatter(15, annual_opex_k[api_idx], s=300, c='purple',
                marker='*', edgecolors='black', linewidth=2, zorder=5)
-    ax5.scatter(CURRENT_DESIGN_MARGIN_PCT, annual_opex[current_idx]/1000, s=250, c='red', 
+    ax5.scatter(CURRENT_DESIGN_MARGIN_PCT, annual_opex_k[current_idx], s=250, c='red', 
                marker='X', edgecolors='black', linewidth=2, zorder=5)
     
     ax5.axvspan(10, 15, alpha=0.2, color='green')
@@ -833,7 +1101,7 @@ def create_comprehensive_plots():
     # ========================================================================
     ax6 = fig.add_subplot(gs[2, 0])
     
-    motor_loads = [r['motor_load_pct'] for r in results]
+    motor_loads = sweep.motor_load_pct
     
     ax6.plot(margins, motor_loads, linewidth=3, color='#17becf', 
             marker='d', markersize=4)
@@ -861,7 +1129,7 @@ def create_comprehensive_plots():
     # ========================================================================
     ax7 = fig.add_subplot(gs[2, 1])
     
-    co2_emissions = [r['annual_co2_tons'] for r in results]
+    co2_emissions = sweep.annual_co2_tons
     
     ax7.plot(margins, co2_emissions, linewidth=3, color='#8c564b', 
             marker='h', markersize=4)
@@ -884,12 +1152,12 @@ def create_comprehensive_plots():
     ax8 = fig.add_subplot(gs[2, 2])
     
     # Compare three scenarios: 10%, 15% (API), Current Design
-    scenarios = [10, 15, int(round(CURRENT_DESIGN_MARGIN_PCT))]
-    scenario_results = [calculate_lifecycle_cost(m, verbose=True, use_part_load_profile=True) for m in scenarios]
+    # (their cost breakdowns are printed by print_scenario_costs, not while plotting)
+    scenario_results = [_lookup_lifecycle_cost(sweep, m) for m in SCENARIO_MARGINS_PCT]
     
     labels = ['Best\nPractice\n(110% CCLPA)', 'API 560\n(115% CCLPA)', 'Current\n(132% CCLPA)']
-    capex = [r['capex_eur']/1000 for r in scenario_results]
-    opex = [r['npv_opex_eur']/1000 for r in scenario_results]
+    capex = np.array([r.capex_eur for r in scenario_results]) / 1000
+    opex = np.array([r.npv_opex_eur for r in scenario_results]) / 1000
     
     x = np.arange(len(labels))
     width = 0.35
@@ -915,9 +1183,7 @@ def create_comprehensive_plots():
     # Main title
     # ========================================================================
     fig.suptitle('Booster Fan Comprehensive Performance & Economic Analysis\nProject: Protos (P-3519)', 
-                fontsize=16, fontweight='bold', y=0.995)
-    
-    plt.tight_layout(rect=[0, 0, 1, 0.99])
+                fontsize=16, fontweight='bold')
     
     return fig
 
@@ -925,117 +1191,164 @@ def create_comprehensive_plots():
 # SUMMARY TABLE
 # ============================================================================
 
-def print_summary_table():
-    """Print detailed comparison table and export to CSV"""
-    print("\n" + "="*100)
+# Console section rules: summary table (100 wide) and script banners (80 wide)
+_TABLE_RULE = "=" * 100
+_TABLE_SEPARATOR = "-" * 100
+_BANNER_RULE = "=" * 80
+
+# Summary table line templates, parsed once (bound str.format methods)
+_SUMMARY_ROW_FMT = ("{:<8} {:<10.1f} {:<10.1f} {:<10.1f} {:<12,.0f} "
+                    "{:<12,.0f} {:<12,.0f} {:<12,.0f} {:<10.1f}").format
+_SUMMARY_DELTA_FMT = (f"{'Delta vs API':<12} {'':<10} {'':<10} {'':<10} "
+                      "{:+12,.0f} {:+12,.0f} {:+12,.0f} {:+12,.0f} {:+10.1f}").format
+
+# Design labels of the summary table margins (unlisted margins have none);
+# API 560 wins if the rounded current margin ever coincides with it
+_DESIGN_TYPES = {10: "Best Practice", 12: "Best Practice",
+                 int(round(CURRENT_DESIGN_MARGIN_PCT)): "CURRENT", 15: "API 560"}
+
+# CSV columns (header, value format); values are rounded by the format
+# string when written instead of by round() beforehand
+_CSV_COLUMNS = (
+    ('Design_Margin_%', '{}'),
+    ('Design_Type', '{}'),
+    ('Motor_Size_kW', '{:.1f}'),
+    ('Motor_Load_%', '{:.1f}'),
+    ('Motor_Efficiency_%', '{:.1f}'),
+    ('Annual_OPEX_EUR', '{:.0f}'),
+    ('CAPEX_EUR', '{:.0f}'),
+    ('NPV_OPEX_30yr_EUR', '{:.0f}'),
+    ('Total_Lifecycle_Cost_EUR', '{:.0f}'),
+    ('Annual_CO2_Tons', '{:.1f}'),
+    ('Delta_OPEX_vs_API_EUR', '{:.0f}'),
+    ('Delta_CAPEX_vs_API_EUR', '{:.0f}'),
+    ('Delta_NPV_OPEX_vs_API_EUR', '{:.0f}'),
+    ('Delta_Total_LC_vs_API_EUR', '{:.0f}'),
+    ('Delta_CO2_vs_API_Tons', '{:.1f}'),
+    ('Flow_Design_m3h', '{:.0f}'),
+    ('Pressure_Design_mbar', '{:.1f}'),
+    ('Annual_Energy_kWh', '{:.0f}'),
+    ('Annual_Maintenance_EUR', '{:.0f}'),
+)
+
+def print_scenario_costs(sweep=None):
+    """
+    Print the cost breakdown of the plot-8 scenarios (SCENARIO_MARGINS_PCT)
+    sweep: optional result arrays from sensitivity_analysis()
+    """
+    for margin in SCENARIO_MARGINS_PCT:
+        print_lifecycle_cost(_lookup_lifecycle_cost(sweep, margin))
+
+def print_summary_table(sweep=None):
+    """
+    Print detailed comparison table and export to CSV
+    sweep: optional result arrays from sensitivity_analysis(); rows for margins
+           not in it are calculated
+    """
+    print("\n" + _TABLE_RULE)
     print("SENSITIVITY ANALYSIS SUMMARY - KEY DESIGN MARGINS")
-    print("="*100)
+    print(_TABLE_RULE)
     
     # Include current design margin (rounded) in analysis
     current_margin_rounded = int(round(CURRENT_DESIGN_MARGIN_PCT))
     margins_to_analyze = [10, 12, 15, 18, 20, 22, 25, 30, current_margin_rounded]
     margins_to_analyze = sorted(list(set(margins_to_analyze)))  # Remove duplicates and sort
     
+    table_margins = margins_to_analyze + [16]  # 16%: key-insight margin
+    if sweep is None or not np.isin(table_margins, sweep.design_margin_pct).all():
+        # Sweep missing or incomplete: evaluate the table margins in one batch
+        # pass instead of one model run per row, with the sweep's profile
+        use_part_load_profile = sweep.use_part_load_profile if sweep is not None else True
+        sweep = calculate_lifecycle_cost_batch(table_margins, use_part_load_profile=use_part_load_profile)
+        sweep = sweep._replace(design_margin_pct=np.array(table_margins))
+    
+    # Table rows as column arrays (row i is margins_to_analyze[i])
+    row_index = [int(np.flatnonzero(sweep.design_margin_pct == m)[0]) for m in margins_to_analyze]
+    table = sweep._replace(**{name: getattr(sweep, name)[row_index] for name in _LIFECYCLE_ARRAY_FIELDS})
+    
     print(f"\n{'Margin':<8} {'Motor':<10} {'Motor':<10} {'Motor':<10} {'Annual':<12} {'CAPEX':<12} "
           f"{'NPV OPEX':<12} {'Total LC':<12} {'CO2/yr':<10}")
     print(f"{'(%)':<8} {'Size(kW)':<10} {'Load(%)':<10} {'Eff(%)':<10} {'OPEX(€)':<12} {'(€)':<12} "
           f"{'30yr(€)':<12} {'Cost(€)':<12} {'(tons)':<10}")
-    print("-"*100)
-    
-    baseline = calculate_lifecycle_cost(15, use_part_load_profile=True)  # API 560 as baseline
-    
-    # Prepare data for CSV export
-    csv_data = []
-    
-    for margin in margins_to_analyze:
-        result = calculate_lifecycle_cost(margin, use_part_load_profile=True)
-        
-        # Calculate deltas vs API 560
-        delta_capex = result['capex_eur'] - baseline['capex_eur']
-        delta_opex = result['annual_opex_eur'] - baseline['annual_opex_eur']
-        delta_total = result['total_lifecycle_cost'] - baseline['total_lifecycle_cost']
-        delta_co2 = result['annual_co2_tons'] - baseline['annual_co2_tons']
-        
-        marker = ""
-        if margin == 15:
-            marker = "API 560"
-        elif margin == current_margin_rounded:
-            marker = "CURRENT"
-        elif margin <= 12:
-            marker = "Best Practice"
-        else:
-            marker = ""
-        
-        # Store data for CSV
-        csv_data.append({
-            'Design_Margin_%': margin,
-            'Design_Type': marker,
-            'Motor_Size_kW': round(result['motor_rated_kw'], 1),
-            'Motor_Load_%': round(result['motor_load_pct'], 1),
-            'Motor_Efficiency_%': round(result['motor_efficiency'] * 100, 1),
-            'Annual_OPEX_EUR': round(result['annual_opex_eur'], 0),
-            'CAPEX_EUR': round(result['capex_eur'], 0),
-            'NPV_OPEX_30yr_EUR': round(result['npv_opex_eur'], 0),
-            'Total_Lifecycle_Cost_EUR': round(result['total_lifecycle_cost'], 0),
-            'Annual_CO2_Tons': round(result['annual_co2_tons'], 1),
-            'Delta_OPEX_vs_API_EUR': round(delta_opex, 0),
-            'Delta_CAPEX_vs_API_EUR': round(delta_capex, 0),
-            'Delta_NPV_OPEX_vs_API_EUR': round(delta_total - delta_capex, 0),
-            'Delta_Total_LC_vs_API_EUR': round(delta_total, 0),
-            'Delta_CO2_vs_API_Tons': round(delta_co2, 1),
-            'Flow_Design_m3h': round(result['flow_design'], 0),
-            'Pressure_Design_mbar': round(result['pressure_design'], 1),
-            'Annual_Energy_kWh': round(result['annual_energy_kwh'], 0),
-            'Annual_Maintenance_EUR': round(result.get('annual_maintenance_eur', 0), 0),
-        })
-        
-        print(f"{margin:<8} {result['motor_rated_kw']:<10.1f} {result['motor_load_pct']:<10.1f} "
-              f"{result['motor_efficiency']*100:<10.1f} {result['annual_opex_eur']:<12,.0f} "
-              f"{result['capex_eur']:<12,.0f} {result['npv_opex_eur']:<12,.0f} "
-              f"{result['total_lifecycle_cost']:<12,.0f} {result['annual_co2_tons']:<10.1f}{' [' + marker + ']' if marker else ''}")
+    print(_TABLE_SEPARATOR)
+    
+    baseline = _lookup_lifecycle_cost(sweep, 15)  # API 560 as baseline
+    
+    # Deltas vs API 560 for all rows at once
+    delta_capex = table.capex_eur - baseline.capex_eur
+    delta_opex = table.annual_opex_eur - baseline.annual_opex_eur
+    delta_total = table.total_lifecycle_cost - baseline.total_lifecycle_cost
+    delta_co2 = table.annual_co2_tons - baseline.annual_co2_tons
+    delta_npv_opex = delta_total - delta_capex
+    
+    # Design labels and their table-row suffixes, looked up once per row
+    design_types = [_DESIGN_TYPES.get(margin, "") for margin in margins_to_analyze]
+    marker_suffixes = [f" [{label}]" if label else "" for label in design_types]
+    
+    # Table lines are printed in one call after the loop
+    table_lines = []
+    
+    for i, margin in enumerate(margins_to_analyze):
+        table_lines.append(
+            _SUMMARY_ROW_FMT(margin, table.motor_rated_kw[i], table.motor_load_pct[i],
+                             table.motor_efficiency[i]*100, table.annual_opex_eur[i],
+                             table.capex_eur[i], table.npv_opex_eur[i],
+                             table.total_lifecycle_cost[i], table.annual_co2_tons[i])
+            + marker_suffixes[i])
         
         if margin != margins_to_analyze[0]:
-            print(f"{'Delta vs API':<12} {'':<10} {'':<10} {'':<10} "
-                  f"{delta_opex:+12,.0f} {delta_capex:+12,.0f} "
-                  f"{delta_total - delta_capex:+12,.0f} {delta_total:+12,.0f} {delta_co2:+10.1f}")
+            table_lines.append(
+                _SUMMARY_DELTA_FMT(delta_opex[i], delta_capex[i], delta_npv_opex[i],
+                                   delta_total[i], delta_co2[i]))
     
-    print("-"*100)
-    key_insight = calculate_lifecycle_cost(16, use_part_load_profile=True)['total_lifecycle_cost'] - baseline['total_lifecycle_cost']
+    table_lines.append(_TABLE_SEPARATOR)
+    print("\n".join(table_lines))
+    key_insight = _lookup_lifecycle_cost(sweep, 16).total_lifecycle_cost - baseline.total_lifecycle_cost
     print(f"\nKey Insight: Every 1% increase in design margin above API 560 costs approximately €{key_insight:.0f} in lifecycle costs")
-    print("="*100)
+    print(_TABLE_RULE)
     
     # Export to CSV
-    script_dir = os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.getcwd()
-    csv_file = os.path.join(script_dir, 'Sensitivity_Analysis_Summary.csv')
-    
-    # Define CSV column headers
-    fieldnames = [
-        'Design_Margin_%',
-        'Design_Type',
-        'Motor_Size_kW',
-        'Motor_Load_%',
-        'Motor_Efficiency_%',
-        'Annual_OPEX_EUR',
-        'CAPEX_EUR',
-        'NPV_OPEX_30yr_EUR',
-        'Total_Lifecycle_Cost_EUR',
-        'Annual_CO2_Tons',
-        'Delta_OPEX_vs_API_EUR',
-        'Delta_CAPEX_vs_API_EUR',
-        'Delta_NPV_OPEX_vs_API_EUR',
-        'Delta_Total_LC_vs_API_EUR',
-        'Delta_CO2_vs_API_Tons',
-        'Flow_Design_m3h',
-        'Pressure_Design_mbar',
-        'Annual_Energy_kWh',
-        'Annual_Maintenance_EUR',
-    ]
+    csv_file = os.path.join(_SCRIPT_DIR, 'Sensitivity_Analysis_Summary.csv')
+    
+    fieldnames = [name for name, _ in _CSV_COLUMNS]
+    csv_formats = [fmt.format for _, fmt in _CSV_COLUMNS]
+    motor_efficiency_pct = table.motor_efficiency * 100
+    
+    def csv_rows():
+        """CSV rows in _CSV_COLUMNS order, formatted as the buffer is filled"""
+        for i, margin in enumerate(margins_to_analyze):
+            values = (
+                margin,  # Design_Margin_%
+                design_types[i],  # Design_Type
+                table.motor_rated_kw[i],  # Motor_Size_kW
+                table.motor_load_pct[i],  # Motor_Load_%
+                motor_efficiency_pct[i],  # Motor_Efficiency_%
+                table.annual_opex_eur[i],  # Annual_OPEX_EUR
+                table.capex_eur[i],  # CAPEX_EUR
+                table.npv_opex_eur[i],  # NPV_OPEX_30yr_EUR
+                table.total_lifecycle_cost[i],  # Total_Lifecycle_Cost_EUR
+                table.annual_co2_tons[i],  # Annual_CO2_Tons
+                delta_opex[i],  # Delta_OPEX_vs_API_EUR
+                delta_capex[i],  # Delta_CAPEX_vs_API_EUR
+                delta_npv_opex[i],  # Delta_NPV_OPEX_vs_API_EUR
+                delta_total[i],  # Delta_Total_LC_vs_API_EUR
+                delta_co2[i],  # Delta_CO2_vs_API_Tons
+                table.flow_design[i],  # Flow_Design_m3h
+                table.pressure_design[i],  # Pressure_Design_mbar
+                table.annual_energy_kwh[i],  # Annual_Energy_kWh
+                table.annual_maintenance_eur[i],  # Annual_Maintenance_EUR
+            )
+            yield [fmt(value) for fmt, value in zip(csv_formats, values)]
     
     try:
+        # The table is tiny: build the CSV text in memory, then write it in one go
+        buffer = io.StringIO(newline='')
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+        writer.writerows(csv_rows())  # Generator rows go straight into the buffer
+        
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(csv_data)
+            f.write(buffer.getvalue())
         
         print(f"\n[OK] Sensitivity analysis summary exported to CSV: {csv_file}")
     except Exception as e:
@@ -1046,50 +1359,68 @@ def print_summary_table():
 # ============================================================================
 
 if __name__ == "__main__":
-    print("="*80)
+    parser = argparse.ArgumentParser(description="Booster fan design margin lifecycle analysis")
+    parser.add_argument('--no-plots', action='store_true',
+                        help="skip the comprehensive figure (summary table and CSV only)")
+    parser.add_argument('--dpi', type=int, default=300,
+                        help="resolution of the saved figure (default: 300)")
+    args = parser.parse_args()
+    
+    if not args.no_plots:
+        # Script runs only write files - no interactive backend needed. Library
+        # callers of create_comprehensive_plots() keep their own backend.
+        import matplotlib
+        matplotlib.use('Agg')
+
+    print(_BANNER_RULE)
     print("BOOSTER FAN ENHANCED VISUALIZATION & SENSITIVITY ANALYSIS")
-    print("="*80)
+    print(_BANNER_RULE)
     
+    # Run the sensitivity sweep once; plots, table and summary reuse its results
+    margins, sweep = sensitivity_analysis(use_part_load_profile=True)
+
     # Generate comprehensive plots
-    fig = create_comprehensive_plots()
+    fig = None if args.no_plots else create_comprehensive_plots(sweep)
+    
+    # Cost breakdown of the plotted scenarios
+    print_scenario_costs(sweep)
     
-    # Save figure
     # Save figure in the same directory as the script
-    import os
-    script_dir = os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.getcwd()
-    output_file = os.path.join(script_dir, 'Booster_Fan_Comprehensive_Analysis.png')
-    fig.savefig(output_file, dpi=300, bbox_inches='tight')
-    print(f"\n[OK] Comprehensive analysis plot saved: {output_file}")
+    if fig is not None:
+        output_file = os.path.join(_SCRIPT_DIR, 'Booster_Fan_Comprehensive_Analysis.png')
+        fig.savefig(output_file, dpi=args.dpi)
+        _pyplot().close(fig)
+        print(f"\n[OK] Comprehensive analysis plot saved: {output_file}")
     
     # Print summary table
-    print_summary_table()
+    print_summary_table(sweep)
     
     # Calculate and display key recommendations
-    print("\n" + "="*80)
+    print("\n" + _BANNER_RULE)
     print("RECOMMENDATION SUMMARY")
-    print("="*80)
+    print(_BANNER_RULE)
     
-    current = calculate_lifecycle_cost(CURRENT_DESIGN_MARGIN_PCT, use_part_load_profile=True)
-    api = calculate_lifecycle_cost(15, use_part_load_profile=True)
-    optimal = calculate_lifecycle_cost(12, use_part_load_profile=True)
+    current = _lookup_lifecycle_cost(sweep, CURRENT_DESIGN_MARGIN_PCT)
+    api = _lookup_lifecycle_cost(sweep, 15)
+    optimal = _lookup_lifecycle_cost(sweep, 12)
     
     print(f"\nCurrent Design (132% CCLPA):")
-    print(f"  - Total Lifecycle Cost: €{current['total_lifecycle_cost']:,.0f}")
-    print(f"  - Motor operates at {current['motor_load_pct']:.1f}% load (inefficient)")
-    print(f"  - Motor efficiency: {current['motor_efficiency']*100:.1f}%")
+    print(f"  - Total Lifecycle Cost: €{current.total_lifecycle_cost:,.0f}")
+    print(f"  - Motor operates at {current.motor_load_pct:.1f}% load (inefficient)")
+    print(f"  - Motor efficiency: {current.motor_efficiency*100:.1f}%")
     
     print(f"\nAPI 560 Design (115% CCLPA):")
-    print(f"  - Total Lifecycle Cost: €{api['total_lifecycle_cost']:,.0f}")
-    print(f"  - Savings vs Current: €{current['total_lifecycle_cost'] - api['total_lifecycle_cost']:,.0f}")
-    print(f"  - Motor operates at {api['motor_load_pct']:.1f}% load (near optimal)")
-    print(f"  - Motor efficiency: {api['motor_efficiency']*100:.1f}%")
+    print(f"  - Total Lifecycle Cost: €{api.total_lifecycle_cost:,.0f}")
+    print(f"  - Savings vs Current: €{current.total_lifecycle_cost - api.total_lifecycle_cost:,.0f}")
+    print(f"  - Motor operates at {api.motor_load_pct:.1f}% load (near optimal)")
+    print(f"  - Motor efficiency: {api.motor_efficiency*100:.1f}%")
     
     print(f"\nBest Practice Design (110% CCLPA):")
-    print(f"  - Total Lifecycle Cost: €{optimal['total_lifecycle_cost']:,.0f}")
-    print(f"  - Savings vs Current: €{current['total_lifecycle_cost'] - optimal['total_lifecycle_cost']:,.0f}")
-    print(f"  - Motor operates at {optimal['motor_load_pct']:.1f}% load (optimal)")
-    print(f"  - Motor efficiency: {optimal['motor_efficiency']*100:.1f}%")
+    print(f"  - Total Lifecycle Cost: €{optimal.total_lifecycle_cost:,.0f}")
+    print(f"  - Savings vs Current: €{current.total_lifecycle_cost - optimal.total_lifecycle_cost:,.0f}")
+    print(f"  - Motor operates at {optimal.motor_load_pct:.1f}% load (optimal)")
+    print(f"  - Motor efficiency: {optimal.motor_efficiency*100:.1f}%")
     
-    print("\n" + "="*80)
+    print("\n" + _BANNER_RULE)
     print("Analysis complete! Check the generated visualization.")
-    print("="*80)
+    print(_BANNER_RULE)